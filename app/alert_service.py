@@ -0,0 +1,33 @@
+from typing import List, Sequence
+
+from sqlmodel import Session, col, select
+
+from app.models import AlertSetting, AlertSettingCreate, AlertSettingUpdate, CoinPair
+
+
+def resolve_coin_pairs(session: Session, symbols: Sequence[str]) -> List[CoinPair]:
+    """CoinPair rows for the given symbols; unknown symbols raise ValueError rather than being dropped"""
+    if not symbols:
+        return []
+    pairs = list(session.exec(select(CoinPair).where(col(CoinPair.symbol).in_(symbols))).all())
+    unknown = set(symbols) - {pair.symbol for pair in pairs}
+    if unknown:
+        raise ValueError(f"Unknown coin pair symbols: {', '.join(sorted(unknown))}")
+    return pairs
+
+
+def create_alert_setting(session: Session, data: AlertSettingCreate) -> AlertSetting:
+    """Add a new alert with its coin_pair_filters symbols resolved into filter_pairs; the caller commits"""
+    alert = AlertSetting(**data.model_dump(exclude={"coin_pair_filters"}))
+    alert.filter_pairs = resolve_coin_pairs(session, data.coin_pair_filters)
+    session.add(alert)
+    return alert
+
+
+def update_alert_setting(session: Session, alert: AlertSetting, data: AlertSettingUpdate) -> AlertSetting:
+    """Apply the fields set on data; coin_pair_filters, when given, replaces filter_pairs. The caller commits"""
+    alert.sqlmodel_update(data.model_dump(exclude_unset=True, exclude={"coin_pair_filters"}))
+    if data.coin_pair_filters is not None:
+        alert.filter_pairs = resolve_coin_pairs(session, data.coin_pair_filters)
+    session.add(alert)
+    return alert
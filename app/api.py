@@ -0,0 +1,63 @@
+from typing import Any
+
+import msgspec
+from fastapi.responses import JSONResponse
+from nicegui import app
+from sqlmodel import select
+
+from app.database import get_async_session
+from app.models import CoinPairResponse, DashboardConfig, NotificationResponse, RSIDataResponse
+from app.queries import active_coin_pairs, dashboard_rsi_snapshot, list_notifications_for_user
+from app.rsi_cache import LatestRSI, cache_latest_rsi, get_latest_rsi, latest_rsi_ttl
+
+
+# Decimals go out as JSON numbers: RSI and price precision fits a JS Number for display
+_encoder = msgspec.json.Encoder(decimal_format="number")
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSONResponse that encodes msgspec Structs (and plain containers) in C.
+
+    Endpoints return instances directly so FastAPI skips jsonable_encoder and response-model validation.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
+
+
+def create():
+    """Read-only JSON endpoints for the dashboard"""
+
+    @app.get("/api/rsi/latest", response_class=MsgspecJSONResponse)
+    async def latest_rsi() -> MsgspecJSONResponse:
+        async with get_async_session() as session:
+            rows = (await session.exec(dashboard_rsi_snapshot())).all()
+            return MsgspecJSONResponse([RSIDataResponse.from_rsi_latest(row, row.coin_pair.symbol) for row in rows])
+
+    @app.get("/api/users/{user_id}/notifications", response_class=MsgspecJSONResponse)
+    async def user_notifications(user_id: int) -> MsgspecJSONResponse:
+        async with get_async_session() as session:
+            notifications = (await session.exec(list_notifications_for_user(user_id))).all()
+            return MsgspecJSONResponse([NotificationResponse.from_notification(n) for n in notifications])
+
+    @app.get("/api/coin-pairs", response_class=MsgspecJSONResponse)
+    async def coin_pairs() -> MsgspecJSONResponse:
+        # Latest RSI comes from the Redis hash; only pairs missing from it hit rsi_data
+        latest = await get_latest_rsi()
+        async with get_async_session() as session:
+            pairs = (await session.exec(active_coin_pairs())).all()
+            missing_ids = [pair.id for pair in pairs if pair.symbol not in latest and pair.id is not None]
+            if missing_ids:
+                fetched = {
+                    row.coin_pair.symbol: LatestRSI.from_rsi_latest(row)
+                    for row in (await session.exec(dashboard_rsi_snapshot(missing_ids))).all()
+                }
+                config = (await session.exec(select(DashboardConfig))).first()
+                await cache_latest_rsi(fetched.items(), latest_rsi_ttl(config))
+                latest.update(fetched)
+
+            payload = []
+            for pair in pairs:
+                cached = latest.get(pair.symbol)
+                payload.append(CoinPairResponse.from_coin_pair(pair, cached.rsi if cached is not None else None))
+            return MsgspecJSONResponse(payload)
@@ -1,10 +1,46 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+import msgspec
+from sqlmodel import (
+    SQLModel,
+    Field,
+    Relationship,
+    Column,
+    Index,
+    BigInteger,
+    Enum as SAEnum,
+    TIMESTAMP,
+    desc,
+    func,
+    text,
+)
+from sqlalchemy import FetchedValue, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from pydantic import ConfigDict
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_EVEN
 from enum import Enum
 
 
+# Fixed-point scales for RSIData integer storage
+RSI_SCALE = 10_000  # 4 decimal places
+PRICE_SCALE = 100_000_000  # 8 decimal places
+VOLUME_SCALE = 10_000  # 4 decimal places; base-asset volumes of low-priced coins reach 1e12 units
+BIGINT_MAX = 2**63 - 1
+
+
+def to_scaled(value: Decimal, scale: int) -> int:
+    """Convert a Decimal to its fixed-point integer representation"""
+    scaled = int((value * scale).to_integral_value(rounding=ROUND_HALF_EVEN))
+    if not -BIGINT_MAX <= scaled <= BIGINT_MAX:
+        raise ValueError(f"{value} does not fit a BIGINT at scale {scale}")
+    return scaled
+
+
+def from_scaled(value: int, scale: int) -> Decimal:
+    """Convert a fixed-point integer back to an exact Decimal"""
+    return Decimal(value) / scale
+
+
 # Enums for better type safety
 class NotificationStatus(str, Enum):
     PENDING = "pending"
@@ -18,8 +54,37 @@ class AlertCondition(str, Enum):
     CUSTOM = "custom"
 
 
+def enum_values(enum_cls: type[Enum]) -> List[str]:
+    """Persist enum values ("pending") rather than member names ("PENDING") in native PG enums"""
+    return [member.value for member in enum_cls]
+
+
+class TimestampsMixin(SQLModel):
+    """Server-managed created_at/updated_at; updated_at is kept current by the set_updated_at trigger"""
+
+    created_at: datetime = Field(
+        sa_type=TIMESTAMP(timezone=True),  # type: ignore[call-overload]
+        sa_column_kwargs={"server_default": func.now()},
+        nullable=False,
+    )
+    updated_at: datetime = Field(
+        sa_type=TIMESTAMP(timezone=True),  # type: ignore[call-overload]
+        sa_column_kwargs={"server_default": func.now(), "server_onupdate": FetchedValue()},  # set_updated_at trigger
+        nullable=False,
+    )
+
+
 # Persistent models (stored in database)
-class CoinPair(SQLModel, table=True):
+class AlertCoinPairFilter(SQLModel, table=True):
+    """Link table: specific coin pairs an alert is restricted to when applies_to_all_pairs is false"""
+
+    __tablename__ = "alert_coin_pair_filters"  # type: ignore[assignment]
+
+    alert_setting_id: int = Field(foreign_key="alert_settings.id", primary_key=True)
+    coin_pair_id: int = Field(foreign_key="coin_pairs.id", primary_key=True, index=True)
+
+
+class CoinPair(TimestampsMixin, table=True):
     """Represents a trading pair from Binance Futures market"""
 
     __tablename__ = "coin_pairs"  # type: ignore[assignment]
@@ -29,26 +94,48 @@ class CoinPair(SQLModel, table=True):
     base_asset: str = Field(max_length=20)  # e.g., "BTC"
     quote_asset: str = Field(max_length=20)  # e.g., "USDT"
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     # Relationships
     rsi_data: List["RSIData"] = Relationship(back_populates="coin_pair")
     user_preferences: List["UserCoinPreference"] = Relationship(back_populates="coin_pair")
     notifications: List["RSINotification"] = Relationship(back_populates="coin_pair")
+    filtered_alert_settings: List["AlertSetting"] = Relationship(
+        back_populates="filter_pairs", link_model=AlertCoinPairFilter
+    )
 
 
 class RSIData(SQLModel, table=True):
     """Stores RSI indicator data for each coin pair"""
 
     __tablename__ = "rsi_data"  # type: ignore[assignment]
+    __table_args__ = (
+        # Per-pair history newest first (charts, the rsi_latest backfill); the INCLUDE columns make it index-only
+        Index(
+            "ix_rsi_pair_ts_desc",
+            "coin_pair_id",
+            desc("timestamp"),
+            postgresql_include=["rsi_value_e4", "price_e8", "volume_e4"],
+        ),
+        # Time-range chart scans; append-mostly timestamps make a tiny BRIN summary as selective as a btree
+        Index("ix_rsi_ts_brin", "timestamp", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        # Daily partitions (see database.maintain_rsi_partitions) keep the hot set small and make retention a DROP
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    coin_pair_id: int = Field(foreign_key="coin_pairs.id", index=True)
-    rsi_value: Decimal = Field(decimal_places=4, max_digits=8)  # RSI value (0-100)
-    price: Decimal = Field(decimal_places=8, max_digits=20)  # Current price
-    volume: Decimal = Field(decimal_places=8, max_digits=20, default=Decimal("0"))  # Trading volume
-    timestamp: datetime = Field(default_factory=datetime.utcnow, index=True)
+    # Partition key must be part of the primary key on a partitioned table; BIGSERIAL, as ticks outrun 2**31 ids
+    id: Optional[int] = Field(
+        default=None, primary_key=True, sa_type=BigInteger, sa_column_kwargs={"autoincrement": True}
+    )
+    coin_pair_id: int = Field(foreign_key="coin_pairs.id")
+    rsi_value_e4: int = Field(sa_column=Column(BigInteger, nullable=False))  # RSI value (0-100) x RSI_SCALE
+    price_e8: int = Field(sa_column=Column(BigInteger, nullable=False))  # Current price x PRICE_SCALE
+    volume_e4: int = Field(default=0, sa_column=Column(BigInteger, nullable=False))  # Trading volume x VOLUME_SCALE
+    # clock_timestamp() rather than now(): rows of one bulk-insert transaction keep distinct, ordered timestamps
+    timestamp: datetime = Field(
+        sa_type=TIMESTAMP(timezone=True),  # type: ignore[call-overload]
+        sa_column_kwargs={"server_default": func.clock_timestamp()},
+        primary_key=True,
+    )
 
     # Technical analysis metadata
     period: int = Field(default=14)  # RSI calculation period
@@ -56,8 +143,47 @@ class RSIData(SQLModel, table=True):
     # Relationships
     coin_pair: CoinPair = Relationship(back_populates="rsi_data")
 
+    @classmethod
+    def from_create(cls, data: "RSIDataCreate") -> "RSIData":
+        return cls(
+            coin_pair_id=data.coin_pair_id,
+            rsi_value_e4=to_scaled(data.rsi_value, RSI_SCALE),
+            price_e8=to_scaled(data.price, PRICE_SCALE),
+            volume_e4=to_scaled(data.volume, VOLUME_SCALE),
+            period=data.period,
+        )
+
+    # Exact Decimal views over the scaled integer columns
+    @property
+    def rsi_value(self) -> Decimal:
+        return from_scaled(self.rsi_value_e4, RSI_SCALE)
+
+    @property
+    def price(self) -> Decimal:
+        return from_scaled(self.price_e8, PRICE_SCALE)
 
-class User(SQLModel, table=True):
+    @property
+    def volume(self) -> Decimal:
+        return from_scaled(self.volume_e4, VOLUME_SCALE)
+
+
+class RSILatest(SQLModel, table=True):
+    """Newest RSI tick per coin pair, kept current by a trigger on rsi_data so the dashboard never scans rsi_data"""
+
+    __tablename__ = "rsi_latest"  # type: ignore[assignment]
+
+    coin_pair_id: int = Field(foreign_key="coin_pairs.id", primary_key=True)
+    rsi_data_id: int = Field(sa_column=Column(BigInteger, nullable=False))  # rsi_data.id of the mirrored row
+    rsi_value_e4: int = Field(sa_column=Column(BigInteger, nullable=False))
+    price_e8: int = Field(sa_column=Column(BigInteger, nullable=False))
+    volume_e4: int = Field(sa_column=Column(BigInteger, nullable=False))
+    period: int
+    timestamp: datetime = Field(sa_type=TIMESTAMP(timezone=True), nullable=False)  # type: ignore[call-overload]
+
+    coin_pair: CoinPair = Relationship()
+
+
+class User(TimestampsMixin, table=True):
     """User accounts for personalized dashboard experience"""
 
     __tablename__ = "users"  # type: ignore[assignment]
@@ -66,8 +192,6 @@ class User(SQLModel, table=True):
     username: str = Field(unique=True, max_length=50)
     email: str = Field(unique=True, max_length=255)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     # Relationships
     coin_preferences: List["UserCoinPreference"] = Relationship(back_populates="user")
@@ -75,25 +199,29 @@ class User(SQLModel, table=True):
     notifications: List["RSINotification"] = Relationship(back_populates="user")
 
 
-class UserCoinPreference(SQLModel, table=True):
+class UserCoinPreference(TimestampsMixin, table=True):
     """Tracks which coin pairs a user wants to monitor"""
 
     __tablename__ = "user_coin_preferences"  # type: ignore[assignment]
+    __table_args__ = (
+        # One row per user and pair: dedup happens on write (ON CONFLICT), never at read time
+        UniqueConstraint("user_id", "coin_pair_id", name="uq_user_pair"),
+        # "My selected pairs, in display order"
+        Index("ix_pref_order", "user_id", "display_order"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
+    user_id: int = Field(foreign_key="users.id")
     coin_pair_id: int = Field(foreign_key="coin_pairs.id", index=True)
     is_selected: bool = Field(default=True)
     display_order: int = Field(default=0)  # For custom ordering
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
 
     # Relationships
     user: User = Relationship(back_populates="coin_preferences")
     coin_pair: CoinPair = Relationship(back_populates="user_preferences")
 
 
-class AlertSetting(SQLModel, table=True):
+class AlertSetting(TimestampsMixin, table=True):
     """User-defined alert thresholds for RSI notifications"""
 
     __tablename__ = "alert_settings"  # type: ignore[assignment]
@@ -101,7 +229,11 @@ class AlertSetting(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
     name: str = Field(max_length=100)  # User-friendly name for the alert
-    condition: AlertCondition = Field(index=True)
+    condition: AlertCondition = Field(
+        sa_column=Column(
+            SAEnum(AlertCondition, name="alert_condition", values_callable=enum_values), index=True, nullable=False
+        )
+    )
 
     # RSI thresholds
     overbought_threshold: Decimal = Field(decimal_places=2, max_digits=5, default=Decimal("70.00"))
@@ -112,21 +244,24 @@ class AlertSetting(SQLModel, table=True):
     custom_operator: Optional[str] = Field(default=None, max_length=10)  # ">=", "<=", "==", etc.
 
     is_enabled: bool = Field(default=True)
-    applies_to_all_pairs: bool = Field(default=True)  # If false, specific pairs in coin_pair_filters
-    coin_pair_filters: List[str] = Field(default=[], sa_column=Column(JSON))  # Specific symbols to monitor
-
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    applies_to_all_pairs: bool = Field(default=True)  # If false, specific pairs in filter_pairs
 
     # Relationships
     user: User = Relationship(back_populates="alert_settings")
     notifications: List["RSINotification"] = Relationship(back_populates="alert_setting")
+    filter_pairs: List[CoinPair] = Relationship(
+        back_populates="filtered_alert_settings", link_model=AlertCoinPairFilter
+    )  # Specific pairs to monitor
 
 
 class RSINotification(SQLModel, table=True):
     """Generated notifications based on alert settings"""
 
     __tablename__ = "rsi_notifications"  # type: ignore[assignment]
+    __table_args__ = (
+        # The dispatcher only ever polls pending rows; this index stays as small as the live queue
+        Index("ix_notif_pending", "created_at", postgresql_where=text("status = 'pending'")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
@@ -139,10 +274,20 @@ class RSINotification(SQLModel, table=True):
     rsi_value: Decimal = Field(decimal_places=4, max_digits=8)
     price_at_alert: Decimal = Field(decimal_places=8, max_digits=20)
 
-    status: NotificationStatus = Field(default=NotificationStatus.PENDING, index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-    sent_at: Optional[datetime] = Field(default=None)
-    dismissed_at: Optional[datetime] = Field(default=None)
+    status: NotificationStatus = Field(
+        default=NotificationStatus.PENDING,
+        sa_column=Column(
+            SAEnum(NotificationStatus, name="notification_status", values_callable=enum_values), nullable=False
+        ),
+    )
+    created_at: datetime = Field(
+        sa_type=TIMESTAMP(timezone=True),  # type: ignore[call-overload]
+        sa_column_kwargs={"server_default": func.now()},
+        nullable=False,
+        index=True,
+    )
+    sent_at: Optional[datetime] = Field(default=None, sa_type=TIMESTAMP(timezone=True))  # type: ignore[call-overload]
+    dismissed_at: Optional[datetime] = Field(default=None, sa_type=TIMESTAMP(timezone=True))  # type: ignore[call-overload]
 
     # Relationships
     user: User = Relationship(back_populates="notifications")
@@ -150,7 +295,7 @@ class RSINotification(SQLModel, table=True):
     alert_setting: AlertSetting = Relationship(back_populates="notifications")
 
 
-class DashboardConfig(SQLModel, table=True):
+class DashboardConfig(TimestampsMixin, table=True):
     """Global dashboard configuration settings"""
 
     __tablename__ = "dashboard_config"  # type: ignore[assignment]
@@ -162,59 +307,70 @@ class DashboardConfig(SQLModel, table=True):
 
     # Display settings
     display_settings: Dict[str, Any] = Field(
-        default={"show_volume": True, "show_price": True, "show_timestamp": True, "theme": "light", "grid_columns": 4},
-        sa_column=Column(JSON),
+        default_factory=lambda: {
+            "show_volume": True,
+            "show_price": True,
+            "show_timestamp": True,
+            "theme": "light",
+            "grid_columns": 4,
+        },
+        sa_column=Column(JSONB),
     )
 
     # Binance API settings
     api_settings: Dict[str, Any] = Field(
-        default={
+        default_factory=lambda: {
             "base_url": "https://fapi.binance.com",
             "rate_limit": 1200,  # requests per minute
             "timeout": 10,
         },
-        sa_column=Column(JSON),
+        sa_column=Column(JSONB),
     )
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
-class CoinPairCreate(SQLModel, table=False):
+class RequestSchema(SQLModel):
+    """Immutable input schema; unknown fields are rejected instead of silently dropped"""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)  # type: ignore[assignment]
+
+
+class CoinPairCreate(RequestSchema, table=False):
     symbol: str = Field(max_length=50)
     base_asset: str = Field(max_length=20)
     quote_asset: str = Field(max_length=20)
     is_active: bool = Field(default=True)
 
 
-class CoinPairUpdate(SQLModel, table=False):
+class CoinPairUpdate(RequestSchema, table=False):
     symbol: Optional[str] = Field(default=None, max_length=50)
     base_asset: Optional[str] = Field(default=None, max_length=20)
     quote_asset: Optional[str] = Field(default=None, max_length=20)
     is_active: Optional[bool] = Field(default=None)
 
 
-class RSIDataCreate(SQLModel, table=False):
+class RSIDataCreate(RequestSchema, table=False):
     coin_pair_id: int
-    rsi_value: Decimal
-    price: Decimal
-    volume: Decimal = Field(default=Decimal("0"))
-    period: int = Field(default=14)
+    rsi_value: Decimal = Field(ge=0, le=100)
+    # Bounded by the scaled BIGINT columns, so a bad tick is rejected here rather than failing its whole batch
+    price: Decimal = Field(ge=0, lt=BIGINT_MAX // PRICE_SCALE)
+    # volume_e4 holds 4 decimal places; finer volumes are rejected rather than silently rounded
+    volume: Decimal = Field(default=Decimal("0"), ge=0, lt=BIGINT_MAX // VOLUME_SCALE, decimal_places=4)
+    period: int = Field(default=14, gt=0, lt=2**31)  # INTEGER column
 
 
-class UserCreate(SQLModel, table=False):
+class UserCreate(RequestSchema, table=False):
     username: str = Field(max_length=50)
     email: str = Field(max_length=255)
 
 
-class UserUpdate(SQLModel, table=False):
+class UserUpdate(RequestSchema, table=False):
     username: Optional[str] = Field(default=None, max_length=50)
     email: Optional[str] = Field(default=None, max_length=255)
     is_active: Optional[bool] = Field(default=None)
 
 
-class AlertSettingCreate(SQLModel, table=False):
+class AlertSettingCreate(RequestSchema, table=False):
     user_id: int
     name: str = Field(max_length=100)
     condition: AlertCondition
@@ -223,10 +379,10 @@ class AlertSettingCreate(SQLModel, table=False):
     custom_threshold: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=5)
     custom_operator: Optional[str] = Field(default=None, max_length=10)
     applies_to_all_pairs: bool = Field(default=True)
-    coin_pair_filters: List[str] = Field(default=[])
+    coin_pair_filters: List[str] = Field(default_factory=list)  # Symbols; app.alert_service resolves them
 
 
-class AlertSettingUpdate(SQLModel, table=False):
+class AlertSettingUpdate(RequestSchema, table=False):
     name: Optional[str] = Field(default=None, max_length=100)
     condition: Optional[AlertCondition] = Field(default=None)
     overbought_threshold: Optional[Decimal] = Field(default=None, decimal_places=2, max_digits=5)
@@ -235,22 +391,22 @@ class AlertSettingUpdate(SQLModel, table=False):
     custom_operator: Optional[str] = Field(default=None, max_length=10)
     is_enabled: Optional[bool] = Field(default=None)
     applies_to_all_pairs: Optional[bool] = Field(default=None)
-    coin_pair_filters: Optional[List[str]] = Field(default=None)
+    coin_pair_filters: Optional[List[str]] = Field(default=None)  # Replaces filter_pairs when set
 
 
-class UserCoinPreferenceCreate(SQLModel, table=False):
+class UserCoinPreferenceCreate(RequestSchema, table=False):
     user_id: int
     coin_pair_id: int
     is_selected: bool = Field(default=True)
     display_order: int = Field(default=0)
 
 
-class UserCoinPreferenceUpdate(SQLModel, table=False):
+class UserCoinPreferenceUpdate(RequestSchema, table=False):
     is_selected: Optional[bool] = Field(default=None)
     display_order: Optional[int] = Field(default=None)
 
 
-class NotificationCreate(SQLModel, table=False):
+class NotificationCreate(RequestSchema, table=False):
     user_id: int
     coin_pair_id: int
     alert_setting_id: int
@@ -260,7 +416,7 @@ class NotificationCreate(SQLModel, table=False):
     price_at_alert: Decimal
 
 
-class DashboardConfigUpdate(SQLModel, table=False):
+class DashboardConfigUpdate(RequestSchema, table=False):
     refresh_interval: Optional[int] = Field(default=None)
     default_rsi_period: Optional[int] = Field(default=None)
     max_historical_records: Optional[int] = Field(default=None)
@@ -268,33 +424,90 @@ class DashboardConfigUpdate(SQLModel, table=False):
     api_settings: Optional[Dict[str, Any]] = Field(default=None)
 
 
-# Response schemas for API endpoints
-class RSIDataResponse(SQLModel, table=False):
+# Response schemas for API endpoints.
+# Server-produced, never validated from input: plain msgspec Structs skip Pydantic and encode to JSON in C.
+class RSIDataResponse(msgspec.Struct, frozen=True, gc=False):
     id: int
     symbol: str
-    rsi_value: str  # Decimal serialized as string
-    price: str  # Decimal serialized as string
-    volume: str  # Decimal serialized as string
+    rsi_value: float
+    price: float
+    volume: float
     timestamp: str  # ISO format datetime
     period: int
 
-
-class CoinPairResponse(SQLModel, table=False):
+    @classmethod
+    def from_rsi_latest(cls, latest: RSILatest, symbol: str) -> "RSIDataResponse":
+        return cls(
+            id=latest.rsi_data_id,
+            symbol=symbol,
+            rsi_value=latest.rsi_value_e4 / RSI_SCALE,
+            price=latest.price_e8 / PRICE_SCALE,
+            volume=latest.volume_e4 / VOLUME_SCALE,
+            timestamp=latest.timestamp.isoformat(),
+            period=latest.period,
+        )
+
+    @classmethod
+    def from_rsi_data(cls, row: RSIData, symbol: str) -> "RSIDataResponse":
+        if row.id is None:
+            raise ValueError("RSIData row must be persisted before building a response")
+        # Straight from the scaled integers, no Decimal on the way; int / int is correctly rounded
+        return cls(
+            id=row.id,
+            symbol=symbol,
+            rsi_value=row.rsi_value_e4 / RSI_SCALE,
+            price=row.price_e8 / PRICE_SCALE,
+            volume=row.volume_e4 / VOLUME_SCALE,
+            timestamp=row.timestamp.isoformat(),
+            period=row.period,
+        )
+
+
+class CoinPairResponse(msgspec.Struct, frozen=True, gc=False):
     id: int
     symbol: str
     base_asset: str
     quote_asset: str
     is_active: bool
     created_at: str  # ISO format datetime
-    latest_rsi: Optional[str] = Field(default=None)  # Latest RSI value as string
-
-
-class NotificationResponse(SQLModel, table=False):
+    latest_rsi: Optional[float] = None
+
+    @classmethod
+    def from_coin_pair(cls, pair: CoinPair, latest_rsi: Optional[float] = None) -> "CoinPairResponse":
+        if pair.id is None:
+            raise ValueError("CoinPair must be persisted before building a response")
+        return cls(
+            id=pair.id,
+            symbol=pair.symbol,
+            base_asset=pair.base_asset,
+            quote_asset=pair.quote_asset,
+            is_active=pair.is_active,
+            created_at=pair.created_at.isoformat(),
+            latest_rsi=latest_rsi,
+        )
+
+
+class NotificationResponse(msgspec.Struct, frozen=True, gc=False):
     id: int
     title: str
     message: str
     symbol: str
-    rsi_value: str  # Decimal as string
-    price_at_alert: str  # Decimal as string
+    rsi_value: Decimal  # Emitted as a JSON number by the API encoder
+    price_at_alert: Decimal  # Emitted as a JSON number by the API encoder
     status: NotificationStatus
     created_at: str  # ISO format datetime
+
+    @classmethod
+    def from_notification(cls, notification: RSINotification) -> "NotificationResponse":
+        if notification.id is None:
+            raise ValueError("RSINotification must be persisted before building a response")
+        return cls(
+            id=notification.id,
+            title=notification.title,
+            message=notification.message,
+            symbol=notification.coin_pair.symbol,
+            rsi_value=notification.rsi_value,
+            price_at_alert=notification.price_at_alert,
+            status=notification.status,
+            created_at=notification.created_at.isoformat(),
+        )
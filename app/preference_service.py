@@ -0,0 +1,14 @@
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session
+
+from app.models import UserCoinPreference, UserCoinPreferenceCreate
+
+
+def upsert_coin_preference(session: Session, data: UserCoinPreferenceCreate) -> None:
+    """Create or update a user's preference for a coin pair in one statement; the caller commits"""
+    stmt = insert(UserCoinPreference).values(**data.model_dump())
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_user_pair",
+        set_={"is_selected": stmt.excluded.is_selected, "display_order": stmt.excluded.display_order},
+    )
+    session.execute(stmt)
@@ -0,0 +1,107 @@
+from typing import List, Optional
+
+from sqlmodel import select, col, desc, literal, or_
+from sqlmodel.sql.expression import SelectOfScalar
+from sqlalchemy.orm import raiseload, selectinload
+
+from app.models import (
+    AlertSetting,
+    AlertCoinPairFilter,
+    CoinPair,
+    NotificationStatus,
+    RSILatest,
+    RSINotification,
+    UserCoinPreference,
+)
+
+
+def alert_settings_for_coin_pair(coin_pair_id: int) -> SelectOfScalar[AlertSetting]:
+    """Enabled alerts that apply to the given coin pair, resolved in one indexed query"""
+    filtered_alert_ids = select(AlertCoinPairFilter.alert_setting_id).where(
+        AlertCoinPairFilter.coin_pair_id == coin_pair_id
+    )
+    return select(AlertSetting).where(
+        col(AlertSetting.is_enabled),
+        or_(
+            col(AlertSetting.applies_to_all_pairs),
+            col(AlertSetting.id).in_(filtered_alert_ids),
+        ),
+    )
+
+
+def alert_settings_for_user(user_id: int) -> SelectOfScalar[AlertSetting]:
+    """A user's alerts with their filter pairs loaded in a single extra query"""
+    load_filter_pairs = selectinload(AlertSetting.filter_pairs)  # type: ignore[arg-type]
+    return select(AlertSetting).where(AlertSetting.user_id == user_id).options(load_filter_pairs)
+
+
+def list_notifications_for_user(user_id: int) -> SelectOfScalar[RSINotification]:
+    """A user's notifications, newest first, with everything the response needs loaded up front.
+
+    raiseload("*") turns any other relationship access into an error instead of a silent per-row query.
+    """
+    return (
+        select(RSINotification)
+        .where(RSINotification.user_id == user_id)
+        .order_by(desc(RSINotification.created_at))
+        .options(
+            selectinload(RSINotification.coin_pair),  # type: ignore[arg-type]
+            selectinload(RSINotification.alert_setting),  # type: ignore[arg-type]
+            raiseload("*"),
+        )
+    )
+
+
+def pending_notifications(limit: int = 100) -> SelectOfScalar[RSINotification]:
+    """Oldest pending notifications for the dispatcher loop.
+
+    The status is rendered inline so the planner can match the ix_notif_pending partial index predicate.
+    """
+    pending = literal(NotificationStatus.PENDING.value, literal_execute=True)
+    return (
+        select(RSINotification)
+        .where(col(RSINotification.status) == pending)
+        .order_by(col(RSINotification.created_at))
+        .limit(limit)
+        .options(
+            selectinload(RSINotification.coin_pair),  # type: ignore[arg-type]
+            selectinload(RSINotification.user),  # type: ignore[arg-type]
+            raiseload("*"),
+        )
+    )
+
+
+def dashboard_rsi_snapshot(coin_pair_ids: Optional[List[int]] = None) -> SelectOfScalar[RSILatest]:
+    """Latest RSI per coin pair (optionally restricted to coin_pair_ids), with its coin pair loaded.
+
+    Reads the one-row-per-pair rsi_latest table instead of a DISTINCT ON over rsi_data.
+    """
+    query = (
+        select(RSILatest)
+        .order_by(col(RSILatest.coin_pair_id))
+        .options(
+            selectinload(RSILatest.coin_pair),  # type: ignore[arg-type]
+            raiseload("*"),
+        )
+    )
+    if coin_pair_ids is not None:
+        query = query.where(col(RSILatest.coin_pair_id).in_(coin_pair_ids))
+    return query
+
+
+def active_coin_pairs() -> SelectOfScalar[CoinPair]:
+    """Active coin pairs in symbol order; relationships are never needed for listing"""
+    return select(CoinPair).where(col(CoinPair.is_active)).order_by(col(CoinPair.symbol)).options(raiseload("*"))
+
+
+def selected_coin_preferences(user_id: int) -> SelectOfScalar[UserCoinPreference]:
+    """A user's selected pairs in display order, served by ix_pref_order"""
+    return (
+        select(UserCoinPreference)
+        .where(UserCoinPreference.user_id == user_id, col(UserCoinPreference.is_selected))
+        .order_by(col(UserCoinPreference.display_order))
+        .options(
+            selectinload(UserCoinPreference.coin_pair),  # type: ignore[arg-type]
+            raiseload("*"),
+        )
+    )
@@ -0,0 +1,129 @@
+import os
+from datetime import datetime
+from logging import getLogger
+from typing import Dict, Iterable, Optional, Tuple
+
+import msgspec
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, WatchError
+
+from app.models import RSI_SCALE, PRICE_SCALE, DashboardConfig, RSILatest
+
+logger = getLogger(__name__)
+
+# Caching is optional: without APP_REDIS_URL every read falls through to the database
+REDIS_URL = os.environ.get("APP_REDIS_URL")
+LATEST_RSI_KEY = "rsi:latest:v2"  # Hash of symbol -> encoded LatestRSI; v2 stores scaled integers
+DEFAULT_REFRESH_INTERVAL = 5  # Seconds, matches DashboardConfig.refresh_interval default
+CACHE_WRITE_ATTEMPTS = 3  # Optimistic (WATCH) retries when another writer changes the hash concurrently
+
+_client: Optional[Redis] = None
+
+
+class LatestRSI(msgspec.Struct, gc=False):
+    rsi_e4: int
+    price_e8: int
+    ts: datetime
+
+    @property
+    def rsi(self) -> float:
+        return self.rsi_e4 / RSI_SCALE
+
+    @property
+    def price(self) -> float:
+        return self.price_e8 / PRICE_SCALE
+
+    @classmethod
+    def from_scaled(cls, rsi_value_e4: int, price_e8: int, timestamp: datetime) -> "LatestRSI":
+        return cls(rsi_e4=rsi_value_e4, price_e8=price_e8, ts=timestamp)
+
+    @classmethod
+    def from_rsi_latest(cls, row: RSILatest) -> "LatestRSI":
+        return cls.from_scaled(row.rsi_value_e4, row.price_e8, row.timestamp)
+
+
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder(LatestRSI)
+
+
+def get_redis() -> Optional[Redis]:
+    global _client
+    if REDIS_URL is None:
+        return None
+    if _client is None:
+        _client = Redis.from_url(REDIS_URL)
+    return _client
+
+
+def latest_rsi_ttl(config: Optional[DashboardConfig]) -> int:
+    """Entries outlive three dashboard refreshes, so a stalled ingest shows up as cache misses"""
+    refresh_interval = config.refresh_interval if config is not None else DEFAULT_REFRESH_INTERVAL
+    return refresh_interval * 3
+
+
+def _decode(symbol: str, raw: bytes) -> Optional[LatestRSI]:
+    try:
+        return _decoder.decode(raw)
+    except msgspec.DecodeError as e:
+        logger.warning(f"Ignoring unreadable latest RSI cache entry for {symbol}: {e}")
+        return None
+
+
+async def cache_latest_rsi(latest: Iterable[Tuple[str, LatestRSI]], ttl: int) -> None:
+    """Write symbol -> latest RSI into the shared hash; called by ingestion and on read-through misses.
+
+    An entry only replaces one with an older timestamp, and every field expires on its own (HEXPIRE, Redis 7.4+),
+    so a pair whose ingest stalls drops out of the hash even while other pairs keep updating.
+    """
+    client = get_redis()
+    if client is None:
+        return
+    values = dict(latest)
+    if not values:
+        return
+    symbols = list(values)
+    try:
+        async with client.pipeline(transaction=True) as pipe:
+            for _ in range(CACHE_WRITE_ATTEMPTS):
+                try:
+                    await pipe.watch(LATEST_RSI_KEY)
+                    cached = await pipe.hmget(LATEST_RSI_KEY, symbols)
+                    newer = {}
+                    for symbol, raw in zip(symbols, cached):
+                        current = _decode(symbol, raw) if raw is not None else None
+                        if current is None or current.ts < values[symbol].ts:
+                            newer[symbol] = _encoder.encode(values[symbol])
+                    if not newer:
+                        return
+                    pipe.multi()
+                    pipe.hset(LATEST_RSI_KEY, mapping=newer)
+                    pipe.hexpire(LATEST_RSI_KEY, ttl, *newer)
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    continue
+        logger.warning(f"Gave up updating latest RSI cache after {CACHE_WRITE_ATTEMPTS} concurrent modifications")
+    except RedisError as e:
+        logger.warning(f"Failed to update latest RSI cache: {e}")
+
+
+async def get_latest_rsi() -> Dict[str, LatestRSI]:
+    """The whole symbol -> latest RSI map in one HGETALL; empty when Redis is unavailable.
+
+    Expired and unreadable entries are simply absent, so callers treat them as misses.
+    """
+    client = get_redis()
+    if client is None:
+        return {}
+    try:
+        raw = await client.hgetall(LATEST_RSI_KEY)
+    except RedisError as e:
+        logger.warning(f"Failed to read latest RSI cache: {e}")
+        return {}
+    latest = {}
+    for key, value in raw.items():
+        symbol = key.decode()
+        decoded = _decode(symbol, value)
+        if decoded is not None:
+            latest[symbol] = decoded
+    return latest
@@ -0,0 +1,146 @@
+import asyncio
+import time
+from logging import getLogger
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Row, literal_column
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database import get_async_session
+from app.models import (
+    CoinPair,
+    DashboardConfig,
+    RSIData,
+    RSIDataCreate,
+    RSI_SCALE,
+    PRICE_SCALE,
+    VOLUME_SCALE,
+    to_scaled,
+)
+from app.rsi_cache import LatestRSI, cache_latest_rsi, latest_rsi_ttl
+
+logger = getLogger(__name__)
+
+RSI_INGEST_BATCH_SIZE = 200  # Rows that trigger an immediate flush
+RSI_CACHE_TTL_REFRESH = 60  # Seconds between re-reads of DashboardConfig for the latest-RSI cache TTL
+RSI_INGEST_MAX_PENDING = 10_000  # Rows kept for retry while the database is unreachable; oldest dropped beyond
+
+
+def rsi_row(data: RSIDataCreate) -> Dict[str, Any]:
+    """Column values for a Core INSERT of one RSI tick"""
+    return {
+        "coin_pair_id": data.coin_pair_id,
+        "rsi_value_e4": to_scaled(data.rsi_value, RSI_SCALE),
+        "price_e8": to_scaled(data.price, PRICE_SCALE),
+        "volume_e4": to_scaled(data.volume, VOLUME_SCALE),
+        "period": data.period,
+    }
+
+
+async def bulk_insert_rsi(session: AsyncSession, rows: List[Dict[str, Any]]) -> Dict[int, Row[Any]]:
+    """Insert many RSI rows in as few round trips as the engine's insertmanyvalues paging allows.
+
+    Bypasses the unit of work (no identity map, flush or per-object events); the caller commits.
+    Timestamps are assigned by the database, and the rsi_data trigger mirrors the newest row per coin pair into
+    rsi_latest. The newest inserted row per coin pair (with its symbol) is returned, keyed by coin_pair_id.
+    """
+    if not rows:
+        return {}
+    stmt = insert(RSIData).returning(
+        col(RSIData.id),
+        col(RSIData.coin_pair_id),
+        col(RSIData.rsi_value_e4),
+        col(RSIData.price_e8),
+        col(RSIData.volume_e4),
+        col(RSIData.period),
+        col(RSIData.timestamp),
+        # The cache is keyed by symbol. Correlated by name: SQLAlchemy doesn't correlate RETURNING subqueries
+        # with the INSERT target, and a lookup after the insert would cost another round trip
+        select(CoinPair.symbol)
+        .where(CoinPair.id == literal_column("rsi_data.coin_pair_id"))
+        .scalar_subquery()
+        .label("symbol"),
+        sort_by_parameter_order=True,
+    )
+    inserted = (await session.execute(stmt, rows)).all()
+
+    # RETURNING follows input order, so later rows win
+    return {row.coin_pair_id: row for row in inserted}
+
+
+async def _write_batch(rows: List[Dict[str, Any]]) -> Dict[str, LatestRSI]:
+    async with get_async_session() as session:
+        newest = await bulk_insert_rsi(session, rows)
+        await session.commit()
+    # Newest row per pair also feeds the latest-RSI cache
+    return {row.symbol: LatestRSI.from_scaled(row.rsi_value_e4, row.price_e8, row.timestamp) for row in newest.values()}
+
+
+async def _read_cache_ttl() -> int:
+    async with get_async_session() as session:
+        return latest_rsi_ttl((await session.exec(select(DashboardConfig))).first())
+
+
+class RSIIngestBuffer:
+    """Collects RSI ticks and writes them in batches, by size or whenever the producer calls flush.
+
+    Rows are validated when added, so a failed write is never the fault of a single row: missing partitions,
+    a coin pair committed by a concurrent transaction or an unreachable database are all expected to clear,
+    and the unwritten rows stay buffered for the next flush. Flushes are serialized.
+    """
+
+    def __init__(self, batch_size: int = RSI_INGEST_BATCH_SIZE, max_pending: int = RSI_INGEST_MAX_PENDING):
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self._rows: List[Dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._cache_ttl: Optional[int] = None
+        self._cache_ttl_read_at = 0.0
+
+    @property
+    def pending(self) -> int:
+        return len(self._rows)
+
+    async def add(self, data: RSIDataCreate) -> None:
+        try:
+            row = rsi_row(data)
+        except ValueError as e:
+            logger.error(f"Dropping RSI tick that does not fit its columns {data}: {e}")
+            return
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._rows:
+                return
+            rows, self._rows = self._rows, []
+            try:
+                latest = await _write_batch(rows)
+            except SQLAlchemyError as e:
+                logger.error(f"Failed to write {len(rows)} RSI rows, keeping them for the next flush: {e}")
+                self._requeue(rows)
+                return
+            try:
+                ttl = await self._latest_rsi_ttl()
+            except SQLAlchemyError as e:
+                logger.warning(f"Skipping latest RSI cache update, dashboard config unreadable: {e}")
+                return
+            await cache_latest_rsi(latest.items(), ttl)
+
+    async def _latest_rsi_ttl(self) -> int:
+        if self._cache_ttl is None or time.monotonic() - self._cache_ttl_read_at > RSI_CACHE_TTL_REFRESH:
+            self._cache_ttl = await _read_cache_ttl()
+            self._cache_ttl_read_at = time.monotonic()
+        return self._cache_ttl
+
+    def _requeue(self, rows: List[Dict[str, Any]]) -> None:
+        self._rows = rows + self._rows
+        overflow = len(self._rows) - self.max_pending
+        if overflow > 0:
+            logger.error(f"RSI ingest buffer full, dropping the {overflow} oldest rows")
+            del self._rows[:overflow]
@@ -1,10 +1,12 @@
 from app.database import create_tables
 from nicegui import ui
+import app.api
 
 
 def startup() -> None:
     # this function is called before the first request
     create_tables()
+    app.api.create()
 
     @ui.page("/")
     def index():
@@ -1,7 +1,9 @@
 import logging
 import os
 from app.startup import startup
-from nicegui import app, ui
+from app.database import ASYNC_ENGINE, maintain_rsi_partitions, RSI_PARTITION_MAINTENANCE_INTERVAL
+from nicegui import app, run, ui
+from sqlalchemy.exc import SQLAlchemyError
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -17,7 +19,9 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         response.headers["X-XSS-Protection"] = "1; mode=block"
         response.headers["X-Content-Type-Options"] = "nosniff"
         response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Content-Security-Policy"] = "default-src 'self' http: https: data: blob: 'unsafe-inline'; frame-ancestors https://app.build/ https://www.app.build/ https://staging.app.build/"
+        response.headers["Content-Security-Policy"] = (
+            "default-src 'self' http: https: data: blob: 'unsafe-inline'; frame-ancestors https://app.build/ https://www.app.build/ https://staging.app.build/"
+        )
         return response
 
 
@@ -31,6 +35,22 @@ logging.getLogger("sqlalchemy.engine.Engine").setLevel(logging.WARNING)
 
 app.on_startup(startup)
 
+
+async def maintain_rsi_partitions_in_thread():
+    # the DDL takes ACCESS EXCLUSIVE on rsi_data; waiting for it on the event loop would stall the very
+    # ingest transaction holding the conflicting lock
+    try:
+        await run.io_bound(maintain_rsi_partitions)
+    except SQLAlchemyError as e:
+        logging.getLogger(__name__).error(f"rsi_data partition maintenance failed: {e}")
+
+
+# roll rsi_data daily partitions forward and drop expired ones (the first run happens in create_tables)
+app.timer(RSI_PARTITION_MAINTENANCE_INTERVAL, maintain_rsi_partitions_in_thread, immediate=False)
+
+# close pooled asyncpg connections on the loop that opened them
+app.on_shutdown(ASYNC_ENGINE.dispose)
+
 # Add security headers middleware
 app.add_middleware(SecurityHeadersMiddleware)
 
@@ -1,12 +1,96 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator, List, Tuple
+import httpx
 import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+import app.api
+import app.rsi_cache
+from app.database import ASYNC_ENGINE, ENGINE, get_session, reset_db
+from app.models import CoinPair, User as AppUser
 from app.startup import startup
+from nicegui import app as nicegui_app
 from nicegui.testing import User
 
 pytest_plugins = ["nicegui.testing.plugin"]
 
 
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    postgres_items = [item for item in items if item.get_closest_marker("postgres") is not None]
+    if not postgres_items:
+        return
+    try:
+        with ENGINE.connect():
+            return
+    except OperationalError:
+        skip = pytest.mark.skip(reason="Postgres at APP_DATABASE_URL is unreachable")
+    for item in postgres_items:
+        item.add_marker(skip)
+
+
 @pytest.fixture
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture()
+def clean_db() -> Generator[None, None, None]:
+    reset_db()
+    yield
+    reset_db()
+
+
+@pytest.fixture()
+def trader(clean_db) -> Tuple[int, List[int]]:
+    """A "trader" user and the BTCUSDT, ETHUSDT and SOLUSDT pairs: (user_id, coin_pair_ids in that order)"""
+    with get_session() as session:
+        user = AppUser(username="trader", email="trader@example.com")
+        pairs = [CoinPair(symbol=f"{base}USDT", base_asset=base, quote_asset="USDT") for base in ("BTC", "ETH", "SOL")]
+        session.add(user)
+        session.add_all(pairs)
+        session.commit()
+        assert user.id is not None
+        return user.id, [pair.id for pair in pairs if pair.id is not None]
+
+
+@pytest.fixture()
+async def async_db() -> AsyncGenerator[None, None]:
+    # Pooled asyncpg connections belong to the loop that opened them, and every test gets a fresh loop
+    yield
+    await ASYNC_ENGINE.dispose()
+
+
+@pytest.fixture()
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> FakeServer:
+    """In-memory Redis behind app.rsi_cache; set connected = False on the server to simulate an outage"""
+    server = FakeServer()
+    monkeypatch.setattr(app.rsi_cache, "REDIS_URL", "redis://fake")
+    monkeypatch.setattr(app.rsi_cache, "_client", FakeAsyncRedis(server=server))
+    return server
+
+
+@pytest.fixture(scope="session")
+def api_routes() -> None:
+    app.api.create()
+
+
+@pytest.fixture()
+async def api_client(api_routes, async_db) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Calls the /api/* handlers in-process, without starting a server"""
+    transport = httpx.ASGITransport(app=nicegui_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture()
+def sql_statements() -> Generator[List[str], None, None]:
+    """Collects every SQL statement the async engine (the /api/* read path) sends while the test runs"""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(ASYNC_ENGINE.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(ASYNC_ENGINE.sync_engine, "before_cursor_execute", before_cursor_execute)
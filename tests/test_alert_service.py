@@ -0,0 +1,45 @@
+import pytest
+
+from app.alert_service import create_alert_setting, update_alert_setting
+from app.database import get_session
+from app.models import AlertCondition, AlertSetting, AlertSettingCreate, AlertSettingUpdate
+
+
+@pytest.mark.postgres
+def test_coin_pair_filters_resolve_into_filter_pairs(trader):
+    user_id, _ = trader
+    with get_session() as session:
+        alert = create_alert_setting(
+            session,
+            AlertSettingCreate(
+                user_id=user_id,
+                name="Majors oversold",
+                condition=AlertCondition.OVERSOLD,
+                applies_to_all_pairs=False,
+                coin_pair_filters=["BTCUSDT"],
+            ),
+        )
+        session.commit()
+        assert [pair.symbol for pair in alert.filter_pairs] == ["BTCUSDT"]
+
+        update_alert_setting(session, alert, AlertSettingUpdate(name="ETH oversold", coin_pair_filters=["ETHUSDT"]))
+        session.commit()
+        alert_id = alert.id
+
+    with get_session() as session:
+        stored = session.get(AlertSetting, alert_id)
+        assert stored is not None
+        assert stored.name == "ETH oversold"
+        assert [pair.symbol for pair in stored.filter_pairs] == ["ETHUSDT"]
+
+
+@pytest.mark.postgres
+def test_unknown_coin_pair_filter_is_rejected(trader):
+    user_id, _ = trader
+    data = AlertSettingCreate(
+        user_id=user_id, name="Typo", condition=AlertCondition.OVERSOLD, coin_pair_filters=["BTCUSDT", "BTCUSTD"]
+    )
+
+    with get_session() as session:
+        with pytest.raises(ValueError, match="BTCUSTD"):
+            create_alert_setting(session, data)
@@ -0,0 +1,79 @@
+"""The JSON endpoints in app.api, with Redis replaced by fakeredis."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict
+
+import httpx
+import pytest
+
+from app.database import get_session
+from app.models import RSIData, RSIDataCreate
+from app.rsi_cache import LATEST_RSI_KEY, LatestRSI, cache_latest_rsi, get_latest_rsi, get_redis
+
+
+@pytest.fixture()
+def stored_rsi(trader) -> Dict[str, float]:
+    """Latest RSI per symbol as stored in the database"""
+    _, coin_pair_ids = trader
+    stored = {"BTCUSDT": 25.5, "ETHUSDT": 61.25, "SOLUSDT": 48.0}
+    with get_session() as session:
+        for coin_pair_id, rsi in zip(coin_pair_ids, stored.values()):
+            data = RSIDataCreate(coin_pair_id=coin_pair_id, rsi_value=Decimal(str(rsi)), price=Decimal("100"))
+            session.add(RSIData.from_create(data))
+        session.commit()
+    return stored
+
+
+def latest_rsi_by_symbol(response: httpx.Response) -> Dict[str, float]:
+    assert response.status_code == 200
+    return {pair["symbol"]: pair["latest_rsi"] for pair in response.json()}
+
+
+@pytest.mark.postgres
+async def test_coin_pairs_served_from_cache(stored_rsi, fake_redis, api_client, sql_statements):
+    cached = {symbol: LatestRSI(rsi_e4=700_000, price_e8=1, ts=datetime.now(timezone.utc)) for symbol in stored_rsi}
+    await cache_latest_rsi(cached.items(), ttl=15)
+
+    response = await api_client.get("/api/coin-pairs")
+
+    assert latest_rsi_by_symbol(response) == {symbol: 70.0 for symbol in stored_rsi}
+    # Only the active-pairs listing reaches the database
+    assert len(sql_statements) == 1
+
+
+@pytest.mark.postgres
+async def test_coin_pairs_cache_miss_writes_back(stored_rsi, fake_redis, api_client):
+    response = await api_client.get("/api/coin-pairs")
+
+    assert latest_rsi_by_symbol(response) == stored_rsi
+    assert {symbol: latest.rsi for symbol, latest in (await get_latest_rsi()).items()} == stored_rsi
+    redis = get_redis()
+    assert redis is not None
+    assert all(ttl > 0 for ttl in await redis.httl(LATEST_RSI_KEY, *stored_rsi))
+
+
+@pytest.mark.postgres
+async def test_coin_pairs_partial_miss_reads_only_missing(stored_rsi, fake_redis, api_client):
+    await cache_latest_rsi([("BTCUSDT", LatestRSI(rsi_e4=700_000, price_e8=1, ts=datetime.now(timezone.utc)))], ttl=15)
+
+    response = await api_client.get("/api/coin-pairs")
+
+    assert latest_rsi_by_symbol(response) == {**stored_rsi, "BTCUSDT": 70.0}
+
+
+@pytest.mark.postgres
+async def test_coin_pairs_without_redis(stored_rsi, fake_redis, api_client):
+    fake_redis.connected = False
+
+    response = await api_client.get("/api/coin-pairs")
+
+    assert latest_rsi_by_symbol(response) == stored_rsi
+
+
+@pytest.mark.postgres
+async def test_latest_rsi(stored_rsi, api_client):
+    response = await api_client.get("/api/rsi/latest")
+
+    assert response.status_code == 200
+    assert {row["symbol"]: row["rsi_value"] for row in response.json()} == stored_rsi
@@ -0,0 +1,177 @@
+import logging
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Generator
+
+import pytest
+from sqlmodel import select, text
+
+from app.database import ENGINE, backfill_rsi_latest, create_tables, get_session, reset_db
+from app.models import (
+    AlertCondition,
+    AlertSetting,
+    NotificationStatus,
+    RSIData,
+    RSIDataCreate,
+    RSILatest,
+    RSINotification,
+    UserCoinPreference,
+)
+
+TODAY = date(2024, 3, 10)
+
+# The subset of the original (pre-partitioning) schema that the upgrade rewrites
+LEGACY_SCHEMA = """
+    CREATE TYPE alertcondition AS ENUM ('OVERBOUGHT', 'OVERSOLD', 'CUSTOM');
+    CREATE TYPE notificationstatus AS ENUM ('PENDING', 'SENT', 'DISMISSED');
+    CREATE TABLE coin_pairs (
+        id SERIAL PRIMARY KEY, symbol VARCHAR(50) NOT NULL UNIQUE, base_asset VARCHAR(20) NOT NULL,
+        quote_asset VARCHAR(20) NOT NULL, is_active BOOLEAN NOT NULL,
+        created_at TIMESTAMP NOT NULL, updated_at TIMESTAMP NOT NULL
+    );
+    CREATE TABLE users (
+        id SERIAL PRIMARY KEY, username VARCHAR(50) NOT NULL UNIQUE, email VARCHAR(255) NOT NULL UNIQUE,
+        is_active BOOLEAN NOT NULL, created_at TIMESTAMP NOT NULL, updated_at TIMESTAMP NOT NULL
+    );
+    CREATE TABLE user_coin_preferences (
+        id SERIAL PRIMARY KEY, user_id INTEGER NOT NULL REFERENCES users (id),
+        coin_pair_id INTEGER NOT NULL REFERENCES coin_pairs (id), is_selected BOOLEAN NOT NULL,
+        display_order INTEGER NOT NULL, created_at TIMESTAMP NOT NULL, updated_at TIMESTAMP NOT NULL
+    );
+    CREATE INDEX ix_user_coin_preferences_user_id ON user_coin_preferences (user_id);
+    CREATE TABLE alert_settings (
+        id SERIAL PRIMARY KEY, user_id INTEGER NOT NULL REFERENCES users (id), name VARCHAR(100) NOT NULL,
+        condition alertcondition NOT NULL, overbought_threshold NUMERIC(5, 2) NOT NULL,
+        oversold_threshold NUMERIC(5, 2) NOT NULL, custom_threshold NUMERIC(5, 2), custom_operator VARCHAR(10),
+        is_enabled BOOLEAN NOT NULL, applies_to_all_pairs BOOLEAN NOT NULL, coin_pair_filters JSON,
+        created_at TIMESTAMP NOT NULL, updated_at TIMESTAMP NOT NULL
+    );
+    CREATE INDEX ix_alert_settings_condition ON alert_settings (condition);
+    CREATE TABLE rsi_data (
+        id SERIAL PRIMARY KEY, coin_pair_id INTEGER NOT NULL REFERENCES coin_pairs (id),
+        rsi_value NUMERIC(8, 4) NOT NULL, price NUMERIC(20, 8) NOT NULL, volume NUMERIC(20, 8) NOT NULL,
+        timestamp TIMESTAMP NOT NULL, period INTEGER NOT NULL
+    );
+    CREATE INDEX ix_rsi_data_timestamp ON rsi_data (timestamp);
+    CREATE TABLE rsi_notifications (
+        id SERIAL PRIMARY KEY, user_id INTEGER NOT NULL REFERENCES users (id),
+        coin_pair_id INTEGER NOT NULL REFERENCES coin_pairs (id),
+        alert_setting_id INTEGER NOT NULL REFERENCES alert_settings (id), title VARCHAR(200) NOT NULL,
+        message VARCHAR(1000) NOT NULL, rsi_value NUMERIC(8, 4) NOT NULL, price_at_alert NUMERIC(20, 8) NOT NULL,
+        status notificationstatus NOT NULL, created_at TIMESTAMP NOT NULL, sent_at TIMESTAMP, dismissed_at TIMESTAMP
+    );
+    CREATE INDEX ix_rsi_notifications_status ON rsi_notifications (status);
+
+    INSERT INTO coin_pairs VALUES (1, 'BTCUSDT', 'BTC', 'USDT', true, '2024-01-01', '2024-01-01');
+    INSERT INTO users VALUES (1, 'trader', 'trader@example.com', true, '2024-01-01', '2024-01-01');
+    INSERT INTO user_coin_preferences VALUES
+        (1, 1, 1, true, 0, '2024-01-01', '2024-01-01'), (2, 1, 1, false, 1, '2024-01-02', '2024-01-02');
+    INSERT INTO alert_settings VALUES
+        (1, 1, 'Oversold', 'OVERSOLD', 70, 30, NULL, NULL, true, false, '["BTCUSDT"]', '2024-01-01', '2024-01-01');
+    INSERT INTO rsi_data VALUES
+        (1, 1, 25.1234, 65432.12345678, 250000000000.5, '2024-02-01 12:00', 14),
+        (2, 1, 28.5, 65000, 12.5, '2024-03-09 12:00', 14),
+        (3, 1, 31.25, 65100, 0.00001, '2024-03-10 08:30', 14);
+    INSERT INTO rsi_notifications VALUES
+        (1, 1, 1, 1, 'BTCUSDT oversold', 'RSI dropped below 30', 28.5, 65000, 'PENDING', '2024-03-09 12:00',
+         NULL, NULL);
+"""
+
+
+@pytest.fixture()
+def legacy_db() -> Generator[None, None, None]:
+    with ENGINE.begin() as conn:
+        conn.execute(text("DROP SCHEMA public CASCADE; CREATE SCHEMA public"))
+        conn.execute(text(LEGACY_SCHEMA))
+    yield
+    reset_db()
+
+
+@pytest.mark.postgres
+def test_create_tables_upgrades_legacy_schema(legacy_db, caplog):
+    with caplog.at_level(logging.WARNING, logger="app.database"):
+        create_tables(today=TODAY)
+    create_tables(today=TODAY)  # Idempotent once upgraded
+
+    # volume_e4 has 4 decimal places; the loss is reported rather than silent
+    assert "Rounding 1 legacy rsi_data volumes to 1/10000 units (1 of them become 0)" in caplog.text
+
+    with get_session() as session:
+        # Rows past the retention window are not carried over; the rest are scaled and read as UTC
+        rows = session.exec(select(RSIData).order_by(RSIData.id)).all()
+        assert [row.id for row in rows] == [2, 3]
+        assert rows[0].rsi_value_e4 == 285000
+        assert rows[0].timestamp == datetime(2024, 3, 9, 12, tzinfo=timezone.utc)
+
+        latest = session.get(RSILatest, 1)
+        assert latest is not None and latest.rsi_data_id == 3
+
+        notification = session.exec(select(RSINotification)).one()
+        assert notification.status == NotificationStatus.PENDING
+
+        alert = session.exec(select(AlertSetting)).one()
+        assert alert.condition == AlertCondition.OVERSOLD
+        assert [pair.symbol for pair in alert.filter_pairs] == ["BTCUSDT"]
+
+        # Duplicate preferences collapse to the newest, and the display-order index replaces the user_id one
+        preference = session.exec(select(UserCoinPreference)).one()
+        assert preference.id == 2
+        indexes = set(
+            session.execute(
+                text("SELECT indexname FROM pg_indexes WHERE tablename = 'user_coin_preferences'")
+            ).scalars()
+        )
+        assert "ix_pref_order" in indexes
+        assert "ix_user_coin_preferences_user_id" not in indexes
+
+        # New ids continue after the copied ones
+        assert session.execute(text("SELECT nextval(pg_get_serial_sequence('rsi_data', 'id'))")).scalar() == 4
+
+
+@pytest.mark.postgres
+def test_create_tables_widens_integer_rsi_data_ids(clean_db):
+    with ENGINE.begin() as conn:
+        conn.execute(text("ALTER TABLE rsi_data ALTER COLUMN id TYPE INTEGER"))
+        conn.execute(text("ALTER SEQUENCE rsi_data_id_seq AS INTEGER"))
+
+    create_tables()
+
+    with ENGINE.connect() as conn:
+        column_type = conn.execute(
+            text(
+                "SELECT data_type FROM information_schema.columns WHERE table_name = 'rsi_data' AND column_name = 'id'"
+            )
+        ).scalar()
+        sequence_type = conn.execute(
+            text("SELECT data_type FROM information_schema.sequences WHERE sequence_name = 'rsi_data_id_seq'")
+        ).scalar()
+    assert (column_type, sequence_type) == ("bigint", "bigint")
+
+
+@pytest.mark.postgres
+def test_backfill_rsi_latest_catches_up_stale_pairs(trader):
+    _, (btc_id, eth_id, _) = trader
+    with get_session() as session:
+        for coin_pair_id, rsi in ((btc_id, "30"), (btc_id, "40"), (eth_id, "60")):
+            session.add(
+                RSIData.from_create(
+                    RSIDataCreate(coin_pair_id=coin_pair_id, rsi_value=Decimal(rsi), price=Decimal("1"))
+                )
+            )
+            session.commit()
+
+    # Rows written before the trigger existed: BTC is behind, ETH is missing
+    with ENGINE.begin() as conn:
+        conn.execute(
+            text(
+                "UPDATE rsi_latest SET timestamp = timestamp - interval '1 day', rsi_value_e4 = 0 "
+                "WHERE coin_pair_id = :id"
+            ),
+            {"id": btc_id},
+        )
+        conn.execute(text("DELETE FROM rsi_latest WHERE coin_pair_id = :id"), {"id": eth_id})
+        backfill_rsi_latest(conn)
+
+    with get_session() as session:
+        latest = {row.coin_pair_id: row.rsi_value_e4 for row in session.exec(select(RSILatest))}
+    assert latest == {btc_id: 400000, eth_id: 600000}
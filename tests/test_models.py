@@ -0,0 +1,140 @@
+from datetime import datetime
+from decimal import Decimal
+
+import msgspec
+import pytest
+from pydantic import ValidationError
+
+from app.api import MsgspecJSONResponse
+from app.database import get_session
+
+from app.models import (
+    PRICE_SCALE,
+    RSI_SCALE,
+    AlertCondition,
+    AlertSettingCreate,
+    CoinPair,
+    DashboardConfig,
+    NotificationResponse,
+    NotificationStatus,
+    RSIData,
+    RSIDataCreate,
+    RSIDataResponse,
+    UserCoinPreferenceUpdate,
+    to_scaled,
+)
+
+
+def test_scaled_round_trip_is_exact():
+    assert to_scaled(Decimal("71.2345"), RSI_SCALE) == 712345
+    assert to_scaled(Decimal("0.00000001"), PRICE_SCALE) == 1
+    assert 712345 / RSI_SCALE == 71.2345
+    assert 6543210000000 / PRICE_SCALE == 65432.1
+
+
+def test_scaled_values_are_bounded_by_bigint():
+    # Meme-coin volumes go well past 1e11 base units
+    row = RSIData.from_create(
+        RSIDataCreate(coin_pair_id=1, rsi_value=Decimal("50"), price=Decimal("0.00001"), volume=Decimal("2.5e11"))
+    )
+    assert row.volume == Decimal("2.5e11")
+
+    with pytest.raises(ValidationError):
+        RSIDataCreate(coin_pair_id=1, rsi_value=Decimal("50"), price=Decimal("1"), volume=Decimal("1e15"))
+    with pytest.raises(ValueError):
+        to_scaled(Decimal("1e12"), PRICE_SCALE)
+
+
+def test_volume_precision_is_not_silently_rounded():
+    data = RSIDataCreate(coin_pair_id=1, rsi_value=Decimal("50"), price=Decimal("1"), volume=Decimal("12.34560000"))
+    assert RSIData.from_create(data).volume == Decimal("12.3456")
+
+    with pytest.raises(ValidationError):
+        RSIDataCreate(coin_pair_id=1, rsi_value=Decimal("50"), price=Decimal("1"), volume=Decimal("0.00001"))
+
+
+def test_rsi_data_decimal_views():
+    row = RSIData.from_create(
+        RSIDataCreate(coin_pair_id=1, rsi_value=Decimal("28.5"), price=Decimal("65432.1"), volume=Decimal("12.5"))
+    )
+
+    assert row.rsi_value_e4 == 285000
+    assert row.rsi_value == Decimal("28.5")
+    assert row.price == Decimal("65432.1")
+    assert row.volume == Decimal("12.5")
+
+
+def test_rsi_data_response_converts_scaled_values():
+    row = RSIData(
+        id=7,
+        coin_pair_id=1,
+        rsi_value_e4=285000,
+        price_e8=6543210000000,
+        volume_e4=0,
+        timestamp=datetime(2024, 1, 1, 12, 0, 0),
+    )
+
+    response = RSIDataResponse.from_rsi_data(row, "BTCUSDT")
+
+    assert response.rsi_value == 28.5
+    assert response.price == 65432.1
+    assert response.volume == 0.0
+    assert response.timestamp == "2024-01-01T12:00:00"
+    assert msgspec.json.decode(msgspec.json.encode(response))["rsi_value"] == 28.5
+
+
+def test_api_encodes_decimals_as_numbers():
+    notification = NotificationResponse(
+        id=1,
+        title="BTCUSDT oversold",
+        message="RSI dropped below 30",
+        symbol="BTCUSDT",
+        rsi_value=Decimal("25.50"),
+        price_at_alert=Decimal("65432.10000000"),
+        status=NotificationStatus.PENDING,
+        created_at="2024-01-01T12:00:00",
+    )
+
+    body = MsgspecJSONResponse([notification]).body
+
+    assert b'"rsi_value":25.50' in body
+    assert msgspec.json.decode(body)[0]["price_at_alert"] == 65432.1
+
+
+def test_mutable_defaults_are_not_shared():
+    first = DashboardConfig()
+    second = DashboardConfig()
+    first.display_settings["theme"] = "dark"
+
+    assert second.display_settings["theme"] == "light"
+    assert first.api_settings is not second.api_settings
+
+    alert = AlertSettingCreate(user_id=1, name="Oversold", condition=AlertCondition.OVERSOLD)
+    alert.coin_pair_filters.append("BTCUSDT")
+    assert AlertSettingCreate(user_id=1, name="Overbought", condition=AlertCondition.OVERBOUGHT).coin_pair_filters == []
+
+
+def test_request_schemas_are_frozen_and_strict():
+    update = UserCoinPreferenceUpdate(display_order=3)
+    with pytest.raises(ValidationError):
+        update.display_order = 4  # type: ignore[misc]
+    with pytest.raises(ValidationError):
+        UserCoinPreferenceUpdate(display_order=3, is_selcted=False)  # type: ignore[call-arg]
+
+
+@pytest.mark.postgres
+def test_timestamps_are_server_managed(clean_db):
+    with get_session() as session:
+        pair = CoinPair(symbol="BTCUSDT", base_asset="BTC", quote_asset="USDT")
+        session.add(pair)
+        session.commit()
+        created_at, updated_at = pair.created_at, pair.updated_at
+
+        assert created_at.tzinfo is not None
+        assert updated_at == created_at
+
+        pair.is_active = False
+        session.commit()
+
+        assert pair.created_at == created_at
+        assert pair.updated_at > updated_at
@@ -0,0 +1,27 @@
+import pytest
+from sqlmodel import select
+
+from app.database import get_session
+from app.models import UserCoinPreference, UserCoinPreferenceCreate
+from app.preference_service import upsert_coin_preference
+from app.queries import selected_coin_preferences
+
+
+@pytest.mark.postgres
+def test_upsert_coin_preference_updates_existing_row(trader):
+    user_id, (btc_id, eth_id, _) = trader
+
+    with get_session() as session:
+        upsert_coin_preference(session, UserCoinPreferenceCreate(user_id=user_id, coin_pair_id=btc_id, display_order=1))
+        upsert_coin_preference(session, UserCoinPreferenceCreate(user_id=user_id, coin_pair_id=eth_id, display_order=0))
+        upsert_coin_preference(
+            session, UserCoinPreferenceCreate(user_id=user_id, coin_pair_id=btc_id, is_selected=False, display_order=2)
+        )
+        session.commit()
+
+    with get_session() as session:
+        preferences = list(session.exec(select(UserCoinPreference)).all())
+        selected = [pref.coin_pair.symbol for pref in session.exec(selected_coin_preferences(user_id)).all()]
+
+    assert len(preferences) == 2
+    assert selected == ["ETHUSDT"]
@@ -0,0 +1,115 @@
+"""Query-count guards for the curated select() builders in app.queries, measured through the /api/* handlers."""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import col, select
+
+from app.database import get_async_session, get_session
+from app.models import (
+    AlertCondition,
+    AlertSetting,
+    CoinPair,
+    NotificationStatus,
+    RSIData,
+    RSIDataCreate,
+    RSINotification,
+)
+from app.queries import list_notifications_for_user, pending_notifications
+
+
+@pytest.fixture()
+def sample_data(trader) -> int:
+    user_id, coin_pair_ids = trader
+    with get_session() as session:
+        pairs = session.exec(select(CoinPair).where(col(CoinPair.id).in_(coin_pair_ids))).all()
+        alert = AlertSetting(user_id=user_id, name="Oversold", condition=AlertCondition.OVERSOLD)
+        session.add(alert)
+        session.commit()
+        assert alert.id is not None
+
+        for pair in pairs:
+            assert pair.id is not None
+            for rsi in ("25.5", "28.1", "31.7"):
+                data = RSIDataCreate(coin_pair_id=pair.id, rsi_value=Decimal(rsi), price=Decimal("100"))
+                session.add(RSIData.from_create(data))
+            session.add(
+                RSINotification(
+                    user_id=user_id,
+                    coin_pair_id=pair.id,
+                    alert_setting_id=alert.id,
+                    title=f"{pair.symbol} oversold",
+                    message="RSI dropped below 30",
+                    rsi_value=Decimal("25.5"),
+                    price_at_alert=Decimal("100"),
+                )
+            )
+        session.commit()
+        return user_id
+
+
+@pytest.mark.postgres
+async def test_latest_rsi_query_count(sample_data, api_client, sql_statements):
+    response = await api_client.get("/api/rsi/latest")
+
+    assert response.status_code == 200
+    assert {row["symbol"] for row in response.json()} == {"BTCUSDT", "ETHUSDT", "SOLUSDT"}
+    # rsi_latest plus one selectin load of the coin pairs
+    assert len(sql_statements) <= 2
+
+
+@pytest.mark.postgres
+async def test_user_notifications_query_count(sample_data, api_client, sql_statements):
+    response = await api_client.get(f"/api/users/{sample_data}/notifications")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    # One query for the notifications plus one selectin load per eager relationship
+    assert len(sql_statements) <= 3
+
+
+@pytest.mark.postgres
+def test_unplanned_lazy_load_raises(sample_data):
+    with get_session() as session:
+        notification = session.exec(list_notifications_for_user(sample_data)).first()
+        assert notification is not None
+
+        with pytest.raises(InvalidRequestError):
+            _ = notification.user
+
+
+@pytest.mark.postgres
+def test_pending_notifications_skips_handled(sample_data):
+    with get_session() as session:
+        handled = session.exec(list_notifications_for_user(sample_data)).first()
+        assert handled is not None
+        handled.status = NotificationStatus.SENT
+        session.commit()
+
+    with get_session() as session:
+        pending = list(session.exec(pending_notifications()).all())
+
+    assert len(pending) == 2
+    assert all(n.status == NotificationStatus.PENDING for n in pending)
+
+
+@pytest.mark.postgres
+async def test_pending_notifications_query_count(sample_data, async_db, sql_statements):
+    async with get_async_session() as session:
+        pending = (await session.exec(pending_notifications())).all()
+        rendered = [(n.coin_pair.symbol, n.user.username) for n in pending]
+
+    assert len(rendered) == 3
+    # The two relationships the dispatcher needs, nothing cascading from them
+    assert len(sql_statements) == 3
+
+
+@pytest.mark.postgres
+async def test_plain_load_leaves_relationships_unloaded(sample_data, async_db, sql_statements):
+    async with get_async_session() as session:
+        notifications = (await session.exec(select(RSINotification))).all()
+
+    assert len(notifications) == 3
+    # Relationships are loaded per query (app.queries), never by model default
+    assert len(sql_statements) == 1
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+
+from app.rsi_cache import LATEST_RSI_KEY, LatestRSI, cache_latest_rsi, get_latest_rsi, get_redis
+
+NOW = datetime(2024, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def latest(rsi: int, ts: datetime) -> LatestRSI:
+    return LatestRSI(rsi_e4=rsi * 10_000, price_e8=100 * 100_000_000, ts=ts)
+
+
+async def test_older_entry_does_not_replace_newer(fake_redis):
+    await cache_latest_rsi([("BTCUSDT", latest(40, NOW))], ttl=15)
+    await cache_latest_rsi([("BTCUSDT", latest(30, NOW - timedelta(seconds=5))), ("ETHUSDT", latest(60, NOW))], ttl=15)
+
+    cached = await get_latest_rsi()
+
+    assert cached["BTCUSDT"].rsi == 40
+    assert cached["ETHUSDT"].rsi == 60
+    assert cached["BTCUSDT"].ts == NOW
+
+
+async def test_each_entry_expires_on_its_own(fake_redis):
+    await cache_latest_rsi([("BTCUSDT", latest(40, NOW))], ttl=15)
+    await cache_latest_rsi([("ETHUSDT", latest(60, NOW))], ttl=30)
+
+    client = get_redis()
+    assert client is not None
+    btc_ttl, eth_ttl = await client.httl(LATEST_RSI_KEY, "BTCUSDT", "ETHUSDT")
+    assert 0 < btc_ttl <= 15 < eth_ttl <= 30
+
+
+async def test_unreadable_entry_is_a_miss(fake_redis):
+    client = get_redis()
+    assert client is not None
+    await client.hset(LATEST_RSI_KEY, mapping={"BTCUSDT": b"not json", "ETHUSDT": b'{"rsi_e4": "x"}'})
+    await cache_latest_rsi([("SOLUSDT", latest(50, NOW))], ttl=15)
+
+    assert set(await get_latest_rsi()) == {"SOLUSDT"}
+
+    # A fresh value replaces the unreadable one
+    await cache_latest_rsi([("BTCUSDT", latest(40, NOW))], ttl=15)
+    assert (await get_latest_rsi())["BTCUSDT"].rsi == 40
+
+
+async def test_unavailable_redis_reads_as_empty(fake_redis):
+    fake_redis.connected = False
+
+    await cache_latest_rsi([("BTCUSDT", latest(40, NOW))], ttl=15)
+
+    assert await get_latest_rsi() == {}
+
+
+async def test_disabled_cache_is_a_no_op(monkeypatch):
+    monkeypatch.setattr("app.rsi_cache.REDIS_URL", None)
+
+    await cache_latest_rsi([("BTCUSDT", latest(40, NOW))], ttl=15)
+
+    assert await get_latest_rsi() == {}
@@ -0,0 +1,191 @@
+import asyncio
+from datetime import timedelta
+from decimal import Decimal
+from typing import List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlmodel import func, select
+
+from app.database import ASYNC_ENGINE, get_async_session, get_session
+from app.models import CoinPair, RSIData, RSIDataCreate, RSILatest
+import app.rsi_ingest
+from app.rsi_cache import get_latest_rsi
+from app.rsi_ingest import RSIIngestBuffer, bulk_insert_rsi, rsi_row
+
+
+@pytest.fixture()
+def coin_pair_id(trader) -> int:
+    _, (btc_id, _, _) = trader
+    return btc_id
+
+
+def count_rsi_rows() -> int:
+    with get_session() as session:
+        result = session.exec(select(func.count()).select_from(RSIData)).first()
+        return result if result is not None else 0
+
+
+@pytest.mark.postgres
+async def test_bulk_insert_rsi_uses_one_statement_per_page(coin_pair_id, async_db):
+    rows = [
+        rsi_row(RSIDataCreate(coin_pair_id=coin_pair_id, rsi_value=Decimal("50"), price=Decimal(str(100 + i))))
+        for i in range(500)
+    ]
+    inserts: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO rsi_data"):
+            inserts.append(statement)
+
+    event.listen(ASYNC_ENGINE.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with get_async_session() as session:
+            await bulk_insert_rsi(session, rows)
+            await session.commit()
+    finally:
+        event.remove(ASYNC_ENGINE.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(inserts) == 1
+    assert count_rsi_rows() == 500
+
+
+@pytest.mark.postgres
+async def test_ingest_buffer_flushes_on_batch_size(coin_pair_id, async_db):
+    buffer = RSIIngestBuffer(batch_size=3)
+    data = RSIDataCreate(coin_pair_id=coin_pair_id, rsi_value=Decimal("42.5"), price=Decimal("100"))
+
+    await buffer.add(data)
+    await buffer.add(data)
+    assert count_rsi_rows() == 0
+
+    await buffer.add(data)
+    assert count_rsi_rows() == 3
+
+    await buffer.add(data)
+    await buffer.flush()
+    assert count_rsi_rows() == 4
+
+
+@pytest.mark.postgres
+async def test_bulk_insert_rsi_keeps_rsi_latest_current(coin_pair_id, async_db):
+    rows = [
+        rsi_row(RSIDataCreate(coin_pair_id=coin_pair_id, rsi_value=Decimal(rsi), price=Decimal("100")))
+        for rsi in ("30", "35", "40")
+    ]
+
+    async with get_async_session() as session:
+        newest = await bulk_insert_rsi(session, rows)
+        await session.commit()
+
+    with get_session() as session:
+        latest = session.get(RSILatest, coin_pair_id)
+        assert latest is not None
+        assert latest.rsi_value_e4 == 400000
+        assert latest.rsi_data_id == newest[coin_pair_id].id
+
+        # An older tick arriving late, by any write path, must not replace the newer one
+        stale = RSIData.from_create(
+            RSIDataCreate(coin_pair_id=coin_pair_id, rsi_value=Decimal("10"), price=Decimal("1"))
+        )
+        stale.timestamp = latest.timestamp - timedelta(microseconds=1)
+        session.add(stale)
+        session.commit()
+        session.refresh(latest)
+        assert latest.rsi_value_e4 == 400000
+
+
+@pytest.mark.postgres
+async def test_ingest_buffer_keeps_rows_the_database_cannot_take_yet(coin_pair_id, async_db, fake_redis):
+    buffer = RSIIngestBuffer(batch_size=100)
+    await buffer.add(RSIDataCreate(coin_pair_id=coin_pair_id, rsi_value=Decimal("50"), price=Decimal("100")))
+    # Ticks can arrive before the transaction adding their coin pair commits
+    await buffer.add(RSIDataCreate(coin_pair_id=1000, rsi_value=Decimal("60"), price=Decimal("1")))
+
+    await buffer.flush()
+    assert buffer.pending == 2
+    assert count_rsi_rows() == 0
+
+    with get_session() as session:
+        session.add(CoinPair(id=1000, symbol="DOGEUSDT", base_asset="DOGE", quote_asset="USDT"))
+        session.commit()
+    await buffer.flush()
+
+    assert buffer.pending == 0
+    assert count_rsi_rows() == 2
+    assert {symbol: latest.rsi for symbol, latest in (await get_latest_rsi()).items()} == {
+        "BTCUSDT": 50,
+        "DOGEUSDT": 60,
+    }
+
+
+@pytest.mark.postgres
+async def test_ingest_buffer_drops_ticks_that_do_not_fit(coin_pair_id, async_db):
+    buffer = RSIIngestBuffer(batch_size=100)
+    # model_construct skips the RSIDataCreate bounds that normally reject this tick
+    oversized = RSIDataCreate.model_construct(
+        coin_pair_id=coin_pair_id, rsi_value=Decimal("50"), price=Decimal("1e12"), volume=Decimal("0"), period=14
+    )
+
+    await buffer.add(oversized)
+    await buffer.add(RSIDataCreate(coin_pair_id=coin_pair_id, rsi_value=Decimal("50"), price=Decimal("100")))
+    await buffer.flush()
+
+    assert buffer.pending == 0
+    assert count_rsi_rows() == 1
+
+
+@pytest.mark.postgres
+async def test_ingest_flush_is_one_statement(coin_pair_id, async_db, fake_redis, sql_statements):
+    buffer = RSIIngestBuffer(batch_size=100)
+    data = RSIDataCreate(coin_pair_id=coin_pair_id, rsi_value=Decimal("50"), price=Decimal("100"))
+
+    for _ in range(3):
+        await buffer.add(data)
+        await buffer.add(data)
+        await buffer.flush()
+
+    # Three inserts; the cache TTL is read from DashboardConfig once, not per flush
+    assert len(sql_statements) == 4
+    assert count_rsi_rows() == 6
+
+
+@pytest.mark.postgres
+async def test_ingest_buffer_keeps_rows_while_database_unavailable(coin_pair_id, async_db, monkeypatch):
+    buffer = RSIIngestBuffer(batch_size=100, max_pending=4)
+    data = RSIDataCreate(coin_pair_id=coin_pair_id, rsi_value=Decimal("50"), price=Decimal("100"))
+    write_batch = app.rsi_ingest._write_batch
+
+    async def unavailable(rows):
+        raise OperationalError("INSERT INTO rsi_data", {}, ConnectionRefusedError())
+
+    monkeypatch.setattr(app.rsi_ingest, "_write_batch", unavailable)
+    for _ in range(3):
+        await buffer.add(data)
+    await buffer.flush()
+    assert buffer.pending == 3
+
+    # Past max_pending the oldest rows go first
+    for _ in range(3):
+        await buffer.add(data)
+    await buffer.flush()
+    assert buffer.pending == 4
+
+    monkeypatch.setattr(app.rsi_ingest, "_write_batch", write_batch)
+    await buffer.flush()
+    assert buffer.pending == 0
+    assert count_rsi_rows() == 4
+
+
+@pytest.mark.postgres
+async def test_concurrent_flushes_write_each_row_once(coin_pair_id, async_db):
+    buffer = RSIIngestBuffer(batch_size=100)
+    data = RSIDataCreate(coin_pair_id=coin_pair_id, rsi_value=Decimal("50"), price=Decimal("100"))
+    for _ in range(5):
+        await buffer.add(data)
+
+    await asyncio.gather(buffer.flush(), buffer.flush(), buffer.add(data))
+    await buffer.flush()
+
+    assert count_rsi_rows() == 6